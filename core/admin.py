@@ -0,0 +1,6 @@
+from django.contrib import admin
+
+from core.models import Player, Team
+
+admin.site.register(Team)
+admin.site.register(Player)
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	initial = True
+
+	dependencies = [
+		migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+	]
+
+	operations = [
+		migrations.CreateModel(
+			name='Team',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				('name', models.CharField(max_length=100, unique=True)),
+				('created_at', models.DateTimeField(auto_now_add=True)),
+				('updated_at', models.DateTimeField(auto_now=True)),
+				(
+					'owner',
+					models.OneToOneField(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='team',
+						to=settings.AUTH_USER_MODEL,
+					),
+				),
+			],
+		),
+		migrations.CreateModel(
+			name='Player',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				('name', models.CharField(max_length=100)),
+				('created_at', models.DateTimeField(auto_now_add=True)),
+				('updated_at', models.DateTimeField(auto_now=True)),
+				(
+					'team',
+					models.ForeignKey(
+						blank=True,
+						null=True,
+						on_delete=django.db.models.deletion.SET_NULL,
+						related_name='players',
+						to='core.team',
+					),
+				),
+			],
+		),
+	]
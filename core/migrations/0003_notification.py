@@ -0,0 +1,38 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	dependencies = [
+		('core', '0002_contract'),
+	]
+
+	operations = [
+		migrations.CreateModel(
+			name='Notification',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				('message', models.CharField(max_length=255)),
+				('read', models.BooleanField(default=False)),
+				('created_at', models.DateTimeField(auto_now_add=True)),
+				(
+					'team',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='notifications',
+						to='core.team',
+					),
+				),
+			],
+		),
+	]
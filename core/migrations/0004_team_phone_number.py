@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	dependencies = [
+		('core', '0003_notification'),
+	]
+
+	operations = [
+		migrations.AddField(
+			model_name='team',
+			name='phone_number',
+			field=models.CharField(blank=True, default='', max_length=20),
+		),
+	]
@@ -0,0 +1,55 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class Team(models.Model):
+	name = models.CharField(max_length=100, unique=True)
+	owner = models.OneToOneField(User, on_delete=models.CASCADE, related_name='team')
+	phone_number = models.CharField(max_length=20, blank=True, default='')
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	def __str__(self):
+		return self.name
+
+
+class Contract(models.Model):
+	player = models.ForeignKey(
+		'Player', on_delete=models.CASCADE, related_name='contracts'
+	)
+	team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='contracts')
+	salary = models.DecimalField(max_digits=12, decimal_places=2)
+	years = models.PositiveIntegerField(default=1)
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	def __str__(self):
+		return f'{self.player} ({self.team})'
+
+
+class Notification(models.Model):
+	team = models.ForeignKey(
+		Team, on_delete=models.CASCADE, related_name='notifications'
+	)
+	message = models.CharField(max_length=255)
+	read = models.BooleanField(default=False)
+	created_at = models.DateTimeField(auto_now_add=True)
+
+	def __str__(self):
+		return f'{self.team}: {self.message}'
+
+
+class Player(models.Model):
+	name = models.CharField(max_length=100)
+	team = models.ForeignKey(
+		Team,
+		on_delete=models.SET_NULL,
+		related_name='players',
+		null=True,
+		blank=True,
+	)
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	def __str__(self):
+		return self.name
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+from core.models import Player
+
+
+class SimplePlayerSerializer(serializers.ModelSerializer):
+	class Meta:
+		model = Player
+		fields = ['id', 'name', 'team']
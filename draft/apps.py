@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class DraftConfig(AppConfig):
+	default_auto_field = 'django.db.models.BigAutoField'
+	name = 'draft'
+
+	def ready(self):
+		from draft import signals  # noqa: F401
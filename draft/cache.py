@@ -0,0 +1,21 @@
+from django.core.cache import cache
+
+
+def eligible_players_key(draft_id):
+	return f'draft:{draft_id}:eligible'
+
+
+def get_eligible_player_ids(draft):
+	"""Return the cached set of draftable player ids for a draft."""
+	key = eligible_players_key(draft.id)
+	eligible = cache.get(key)
+
+	if eligible is None:
+		eligible = set(draft.draftable_players.values_list('id', flat=True))
+		cache.set(key, eligible, None)
+
+	return eligible
+
+
+def invalidate_eligible_players(draft_id):
+	cache.delete(eligible_players_key(draft_id))
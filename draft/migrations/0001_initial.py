@@ -0,0 +1,89 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	initial = True
+
+	dependencies = [
+		('core', '0001_initial'),
+	]
+
+	operations = [
+		migrations.CreateModel(
+			name='Draft',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				('name', models.CharField(max_length=100)),
+				('year', models.PositiveIntegerField()),
+				('rounds', models.PositiveIntegerField(default=2)),
+				('created_at', models.DateTimeField(auto_now_add=True)),
+				('updated_at', models.DateTimeField(auto_now=True)),
+				(
+					'draftable_players',
+					models.ManyToManyField(
+						blank=True, related_name='drafts', to='core.player'
+					),
+				),
+			],
+		),
+		migrations.CreateModel(
+			name='DraftPick',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				('round_number', models.PositiveIntegerField()),
+				('pick_number', models.PositiveIntegerField()),
+				('overall_pick', models.PositiveIntegerField()),
+				('is_pick_made', models.BooleanField(default=False)),
+				('pick_made_at', models.DateTimeField(blank=True, null=True)),
+				(
+					'draft',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='picks',
+						to='draft.draft',
+					),
+				),
+				(
+					'selected_player',
+					models.ForeignKey(
+						blank=True,
+						null=True,
+						on_delete=django.db.models.deletion.SET_NULL,
+						related_name='draft_selections',
+						to='core.player',
+					),
+				),
+				(
+					'team',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='draft_picks',
+						to='core.team',
+					),
+				),
+			],
+			options={
+				'ordering': ['overall_pick'],
+				'unique_together': {('draft', 'overall_pick')},
+			},
+		),
+	]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_contract'),
+        ('draft', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Pick',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveIntegerField()),
+                ('round_number', models.PositiveIntegerField()),
+                ('protection', models.CharField(default='unprotected', max_length=20)),
+                ('protection_metadata', models.TextField(blank=True, default='{}')),
+                ('current_team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='owned_picks', to='core.team')),
+                ('original_team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='original_picks', to='core.team')),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-09-01 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	dependencies = [
+		('draft', '0002_pick'),
+	]
+
+	operations = [
+		migrations.AlterField(
+			model_name='pick',
+			name='protection_metadata',
+			field=models.JSONField(blank=True, default=dict),
+		),
+	]
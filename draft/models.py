@@ -0,0 +1,59 @@
+from django.db import models
+
+from core.models import Player, Team
+
+
+class Draft(models.Model):
+	name = models.CharField(max_length=100)
+	year = models.PositiveIntegerField()
+	rounds = models.PositiveIntegerField(default=2)
+	draftable_players = models.ManyToManyField(
+		Player, related_name='drafts', blank=True
+	)
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	def __str__(self):
+		return f'{self.name} ({self.year})'
+
+
+class Pick(models.Model):
+	"""A tradeable future draft pick."""
+
+	original_team = models.ForeignKey(
+		Team, on_delete=models.CASCADE, related_name='original_picks'
+	)
+	current_team = models.ForeignKey(
+		Team, on_delete=models.CASCADE, related_name='owned_picks'
+	)
+	year = models.PositiveIntegerField()
+	round_number = models.PositiveIntegerField()
+	protection = models.CharField(max_length=20, default='unprotected')
+	protection_metadata = models.JSONField(blank=True, default=dict)
+
+	def __str__(self):
+		return f'{self.year} round {self.round_number} ({self.original_team})'
+
+
+class DraftPick(models.Model):
+	draft = models.ForeignKey(Draft, on_delete=models.CASCADE, related_name='picks')
+	team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='draft_picks')
+	round_number = models.PositiveIntegerField()
+	pick_number = models.PositiveIntegerField()
+	overall_pick = models.PositiveIntegerField()
+	selected_player = models.ForeignKey(
+		Player,
+		on_delete=models.SET_NULL,
+		related_name='draft_selections',
+		null=True,
+		blank=True,
+	)
+	is_pick_made = models.BooleanField(default=False)
+	pick_made_at = models.DateTimeField(null=True, blank=True)
+
+	class Meta:
+		ordering = ['overall_pick']
+		unique_together = ['draft', 'overall_pick']
+
+	def __str__(self):
+		return f'{self.draft} - pick {self.overall_pick} ({self.team})'
@@ -0,0 +1,71 @@
+from rest_framework import serializers
+
+from draft.models import DraftPick, Pick
+from ftt.common.util import get_number_suffix
+
+
+class PickSerializer(serializers.ModelSerializer):
+	class Meta:
+		model = Pick
+		fields = [
+			'id',
+			'original_team',
+			'current_team',
+			'year',
+			'round_number',
+			'protection',
+		]
+
+
+class DraftPositionSerializer(serializers.ModelSerializer):
+	team_name = serializers.CharField(source='team.name', read_only=True)
+	selected_player_name = serializers.SerializerMethodField()
+	round_label = serializers.SerializerMethodField()
+
+	class Meta:
+		model = DraftPick
+		fields = [
+			'id',
+			'round_number',
+			'round_label',
+			'pick_number',
+			'overall_pick',
+			'team',
+			'team_name',
+			'selected_player',
+			'selected_player_name',
+			'is_pick_made',
+			'pick_made_at',
+		]
+
+	def get_selected_player_name(self, obj):
+		return obj.selected_player.name if obj.selected_player else None
+
+	def get_round_label(self, obj):
+		return f'{obj.round_number}{get_number_suffix(obj.round_number)} round'
+
+
+def serialize_draft_position(position):
+	"""Build the read-only board row as a plain dict.
+
+	Rendering a full board through DraftPositionSerializer repeats DRF's
+	field binding and get_attribute dispatch per row; this keeps the exact
+	same payload while doing direct attribute access. The DRF serializer
+	stays in place for write paths.
+	"""
+	round_number = position.round_number
+	selected_player = position.selected_player
+
+	return {
+		'id': position.id,
+		'round_number': round_number,
+		'round_label': f'{round_number}{get_number_suffix(round_number)} round',
+		'pick_number': position.pick_number,
+		'overall_pick': position.overall_pick,
+		'team': position.team_id,
+		'team_name': position.team.name,
+		'selected_player': position.selected_player_id,
+		'selected_player_name': selected_player.name if selected_player else None,
+		'is_pick_made': position.is_pick_made,
+		'pick_made_at': position.pick_made_at,
+	}
@@ -0,0 +1,10 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from draft.cache import invalidate_eligible_players
+from draft.models import Draft
+
+
+@receiver(m2m_changed, sender=Draft.draftable_players.through)
+def draftable_players_changed(sender, instance, **kwargs):
+	invalidate_eligible_players(instance.id)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from draft import views
+
+urlpatterns = [
+	path(
+		'<int:draft_id>/generate-order/',
+		views.generate_draft_order,
+		name='generate-draft-order',
+	),
+	path('<int:draft_id>/board/', views.draft_board, name='draft-board'),
+	path('<int:draft_id>/pick/', views.make_draft_pick, name='make-draft-pick'),
+]
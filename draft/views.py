@@ -0,0 +1,137 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from core.models import Player, Team
+from draft.cache import get_eligible_player_ids
+from draft.models import Draft, DraftPick
+from draft.serializers import serialize_draft_position
+
+
+@api_view(['POST'])
+def generate_draft_order(request, draft_id):
+	"""Regenerate the snake-order pick board for a draft."""
+	draft = get_object_or_404(Draft, pk=draft_id)
+
+	teams_order = request.data.get('team_order') or list(
+		Team.objects.order_by('name').values_list('id', flat=True)
+	)
+
+	if not teams_order:
+		return Response(
+			{'detail': 'No teams available to generate a draft order.'},
+			status=status.HTTP_400_BAD_REQUEST,
+		)
+
+	forward, backward = teams_order, teams_order[::-1]
+	overall_pick = 1
+	picks = []
+
+	for round_num in range(1, draft.rounds + 1):
+		pick_order = forward if round_num % 2 else backward
+
+		for pick_num, team_id in enumerate(pick_order, start=1):
+			picks.append(
+				DraftPick(
+					draft=draft,
+					team_id=team_id,
+					round_number=round_num,
+					pick_number=pick_num,
+					overall_pick=overall_pick,
+				)
+			)
+			overall_pick += 1
+
+	with transaction.atomic():
+		DraftPick.objects.filter(draft=draft).delete()
+		DraftPick.objects.bulk_create(picks, batch_size=1000)
+
+	return Response(
+		{'detail': f'Generated {len(picks)} picks for {draft}.'},
+		status=status.HTTP_201_CREATED,
+	)
+
+
+@api_view(['GET'])
+def draft_board(request, draft_id):
+	"""Return every pick of a draft plus the position currently on the clock."""
+	draft = get_object_or_404(Draft, pk=draft_id)
+
+	positions = (
+		DraftPick.objects.filter(draft=draft)
+		.select_related('team', 'selected_player', 'selected_player__team', 'draft')
+		.order_by('overall_pick')
+	)
+
+	positions = list(positions)
+	next_pick = next(
+		(position for position in positions if not position.is_pick_made), None
+	)
+
+	return Response(
+		{
+			'draft': str(draft),
+			'positions': [serialize_draft_position(position) for position in positions],
+			'next_pick': serialize_draft_position(next_pick) if next_pick else None,
+		}
+	)
+
+
+@api_view(['POST'])
+def make_draft_pick(request, draft_id):
+	"""Record the next pick of a draft for the team currently on the clock."""
+	draft = get_object_or_404(Draft, pk=draft_id)
+	player_id = request.data.get('player_id')
+
+	try:
+		player_id = int(player_id)
+	except (TypeError, ValueError):
+		return Response(
+			{'detail': 'A valid player_id is required.'},
+			status=status.HTTP_400_BAD_REQUEST,
+		)
+
+	position = (
+		DraftPick.objects.filter(draft=draft, is_pick_made=False)
+		.order_by('overall_pick')
+		.first()
+	)
+
+	if position is None:
+		return Response(
+			{'detail': 'All picks for this draft have already been made.'},
+			status=status.HTTP_400_BAD_REQUEST,
+		)
+
+	if player_id not in get_eligible_player_ids(draft):
+		return Response(
+			{'detail': 'Player is not draftable in this draft.'},
+			status=status.HTTP_400_BAD_REQUEST,
+		)
+
+	if DraftPick.objects.filter(draft=draft, selected_player_id=player_id).exists():
+		return Response(
+			{'detail': 'Player has already been selected.'},
+			status=status.HTTP_400_BAD_REQUEST,
+		)
+
+	updated = Player.objects.filter(id=player_id).update(team_id=position.team_id)
+
+	if not updated:
+		return Response(
+			{'detail': 'Player not found.'},
+			status=status.HTTP_404_NOT_FOUND,
+		)
+
+	position.selected_player_id = player_id
+	position.is_pick_made = True
+	position.pick_made_at = timezone.now()
+	position.save()
+
+	return Response(
+		{'detail': f'Player {player_id} selected at pick {position.overall_pick}.'},
+		status=status.HTTP_200_OK,
+	)
@@ -0,0 +1,21 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+	"""JSON renderer backed by orjson's native encoder.
+
+	orjson encodes datetimes and UUIDs in C instead of the per-object
+	Python callbacks json.dumps runs for the same types; anything it
+	does not handle natively (e.g. Decimal) falls back to str.
+	"""
+
+	media_type = 'application/json'
+	format = 'json'
+	charset = None
+
+	def render(self, data, accepted_media_type=None, renderer_context=None):
+		if data is None:
+			return b''
+
+		return orjson.dumps(data, default=str)
@@ -0,0 +1 @@
+from ftt.common.singletons.sms import get_sms_service, sms_service
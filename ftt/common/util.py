@@ -0,0 +1,71 @@
+from functools import lru_cache
+
+from django.forms.models import model_to_dict
+
+_NO_EXCLUDES = frozenset()
+
+
+@lru_cache(maxsize=None)
+def _model_fields_cached(model, exclude_fields):
+	return tuple(
+		field.name for field in model._meta.fields if field.name not in exclude_fields
+	)
+
+
+def get_django_model_fields(model, exclude_fields=None):
+	"""Return the concrete field names of a Django model.
+
+	The walk over model._meta is memoized per (model, excludes) pair since
+	field definitions do not change at runtime.
+	"""
+	if exclude_fields is None:
+		exclude_fields = _NO_EXCLUDES
+
+	return _model_fields_cached(model, frozenset(exclude_fields))
+
+
+def django_obj_to_dict(obj, exclude_fields=None):
+	"""Serialize a Django model instance to a plain dict."""
+	return model_to_dict(obj, fields=get_django_model_fields(type(obj), exclude_fields))
+
+
+@lru_cache(maxsize=None)
+def _model_attnames_cached(model, exclude_fields):
+	return tuple(
+		field.attname
+		for field in model._meta.concrete_fields
+		if field.name not in exclude_fields
+	)
+
+
+def fast_obj_to_dict(obj, exclude_fields=None):
+	"""Project a model instance straight to a dict of scalar columns.
+
+	Unlike model_to_dict this skips per-field-type dispatch, so it is only
+	safe for plain-column models (no M2M or file fields). FK columns come
+	out under their *_id attnames, without hydrating the related object.
+	"""
+	attnames = _model_attnames_cached(
+		type(obj), frozenset(exclude_fields) if exclude_fields else _NO_EXCLUDES
+	)
+	data = obj.__dict__
+	return {
+		name: data[name] if name in data else getattr(obj, name) for name in attnames
+	}
+
+
+def _compute_suffix(number):
+	if 10 <= number % 100 <= 20:
+		return 'th'
+
+	return {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+
+
+# Ordinal suffixes repeat every 100 numbers, so the full rule set collapses
+# into one table computed at import time.
+_SUFFIXES = tuple(_compute_suffix(number) for number in range(100))
+
+
+def get_number_suffix(number):
+	"""Return the ordinal suffix ('st', 'nd', 'rd' or 'th') for a number."""
+	return _SUFFIXES[int(number) % 100]
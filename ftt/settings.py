@@ -43,7 +43,10 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'rest_framework',
-    'auction'
+    'auction',
+    'core',
+    'draft',
+    'trade',
 ]
 
 MIDDLEWARE = [
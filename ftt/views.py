@@ -0,0 +1,11 @@
+from django.http import HttpResponse
+
+# Health probes are polled constantly by load balancers, so the payload is
+# rendered once at import and served as a plain Django view, skipping DRF's
+# content negotiation and renderer pipeline entirely.
+_HEALTH_PAYLOAD = b'"Server is up."'
+
+
+def health_check(request):
+	"""Liveness probe for load balancers and orchestration."""
+	return HttpResponse(_HEALTH_PAYLOAD, content_type='application/json')
@@ -0,0 +1,7 @@
+from django.contrib import admin
+
+from trade.models import Trade, TradeAsset, TradeStatus
+
+admin.site.register(Trade)
+admin.site.register(TradeStatus)
+admin.site.register(TradeAsset)
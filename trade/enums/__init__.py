@@ -0,0 +1 @@
+from trade.enums.trade_statuses import TradeStatuses
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class TradeStatuses(models.TextChoices):
+	DRAFT = 'draft'
+	SENT = 'sent'
+	ACCEPTED = 'accepted'
+	REJECTED = 'rejected'
+	COUNTEROFFER = 'counteroffer'
+	PENDING = 'pending'
+	APPROVED = 'approved'
+	VETOED = 'vetoed'
+
+	@classmethod
+	def get_staff_only_statuses(cls):
+		return _STAFF_ONLY
+
+
+# Built once at module load; callers get O(1) membership tests against the
+# shared frozenset instead of a freshly allocated list per call.
+_STAFF_ONLY = frozenset(
+	{TradeStatuses.PENDING, TradeStatuses.APPROVED, TradeStatuses.VETOED}
+)
@@ -0,0 +1,169 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	initial = True
+
+	dependencies = [
+		('core', '0002_contract'),
+		('draft', '0002_pick'),
+	]
+
+	operations = [
+		migrations.CreateModel(
+			name='Trade',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				('done', models.BooleanField(default=False)),
+				('created_at', models.DateTimeField(auto_now_add=True)),
+				('updated_at', models.DateTimeField(auto_now=True)),
+				(
+					'parent',
+					models.ForeignKey(
+						blank=True,
+						null=True,
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='succeeded_by',
+						to='trade.trade',
+					),
+				),
+				(
+					'participants',
+					models.ManyToManyField(related_name='trades', to='core.team'),
+				),
+				(
+					'sender',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='sent_trades',
+						to='core.team',
+					),
+				),
+			],
+		),
+		migrations.CreateModel(
+			name='TradeAsset',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				(
+					'asset_type',
+					models.CharField(
+						choices=[('player', 'Player'), ('pick', 'Pick')], max_length=10
+					),
+				),
+				(
+					'draft_pick',
+					models.ForeignKey(
+						blank=True,
+						null=True,
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='trade_assets',
+						to='draft.pick',
+					),
+				),
+				(
+					'player_contract',
+					models.ForeignKey(
+						blank=True,
+						null=True,
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='trade_assets',
+						to='core.contract',
+					),
+				),
+				(
+					'receiver',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='received_trade_assets',
+						to='core.team',
+					),
+				),
+				(
+					'sender',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='sent_trade_assets',
+						to='core.team',
+					),
+				),
+				(
+					'trade',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='assets',
+						to='trade.trade',
+					),
+				),
+			],
+		),
+		migrations.CreateModel(
+			name='TradeStatus',
+			fields=[
+				(
+					'id',
+					models.BigAutoField(
+						auto_created=True,
+						primary_key=True,
+						serialize=False,
+						verbose_name='ID',
+					),
+				),
+				(
+					'status',
+					models.CharField(
+						choices=[
+							('draft', 'DRAFT'),
+							('sent', 'SENT'),
+							('accepted', 'ACCEPTED'),
+							('rejected', 'REJECTED'),
+							('counteroffer', 'COUNTEROFFER'),
+							('pending', 'PENDING'),
+							('approved', 'APPROVED'),
+							('vetoed', 'VETOED'),
+						],
+						max_length=20,
+					),
+				),
+				('created_at', models.DateTimeField(auto_now_add=True)),
+				(
+					'actioned_by',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='trade_statuses',
+						to='core.team',
+					),
+				),
+				(
+					'trade',
+					models.ForeignKey(
+						on_delete=django.db.models.deletion.CASCADE,
+						related_name='statuses',
+						to='trade.trade',
+					),
+				),
+			],
+			options={
+				'unique_together': {('trade', 'actioned_by', 'status')},
+			},
+		),
+	]
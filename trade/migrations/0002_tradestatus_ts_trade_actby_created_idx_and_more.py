@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	dependencies = [
+		('core', '0004_team_phone_number'),
+		('trade', '0001_initial'),
+	]
+
+	operations = [
+		migrations.AddIndex(
+			model_name='tradestatus',
+			index=models.Index(
+				fields=['trade', 'actioned_by', '-created_at'],
+				name='ts_trade_actby_created_idx',
+			),
+		),
+		migrations.AddIndex(
+			model_name='tradestatus',
+			index=models.Index(fields=['trade', 'status'], name='ts_trade_status_idx'),
+		),
+	]
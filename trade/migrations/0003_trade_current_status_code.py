@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	dependencies = [
+		('trade', '0002_tradestatus_ts_trade_actby_created_idx_and_more'),
+	]
+
+	operations = [
+		migrations.AddField(
+			model_name='trade',
+			name='current_status_code',
+			field=models.SmallIntegerField(default=0),
+		),
+	]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-09-01 15:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+	dependencies = [
+		('trade', '0003_trade_current_status_code'),
+	]
+
+	operations = [
+		migrations.AlterField(
+			model_name='tradestatus',
+			name='status',
+			field=models.CharField(
+				choices=[
+					('draft', 'Draft'),
+					('sent', 'Sent'),
+					('accepted', 'Accepted'),
+					('rejected', 'Rejected'),
+					('counteroffer', 'Counteroffer'),
+					('pending', 'Pending'),
+					('approved', 'Approved'),
+					('vetoed', 'Vetoed'),
+				],
+				max_length=20,
+			),
+		),
+	]
@@ -0,0 +1 @@
+from trade.models.trade import Trade, TradeAsset, TradeStatus
@@ -0,0 +1,768 @@
+import logging
+from collections import defaultdict, namedtuple
+from functools import cached_property
+from types import SimpleNamespace
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Sum, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from core.models import Contract, Notification, Team
+from draft.models import Pick
+from ftt.common.singletons import sms_service
+from ftt.common.util import fast_obj_to_dict
+from trade.enums import TradeStatuses
+
+logger = logging.getLogger(__name__)
+
+TimelineEntry = namedtuple('TimelineEntry', ['team', 'action', 'timestamp'])
+
+MAX_ROSTER_SIZE = 15
+SALARY_CAP = 200_000_000
+
+# Statuses that settle a trade, mapped to the overall state code.
+_STATUS_CODES = {
+	TradeStatuses.REJECTED: -1,
+	TradeStatuses.VETOED: -1,
+	TradeStatuses.APPROVED: 1,
+}
+
+
+class TradeQuerySet(models.QuerySet):
+	def with_has_successor(self):
+		"""Annotate whether a counteroffer supersedes each trade.
+
+		List views should use this so Trade.is_latest reads the annotated
+		column instead of issuing an EXISTS probe per row.
+		"""
+		return self.annotate(
+			_has_successor=models.Exists(
+				Trade.objects.filter(parent=models.OuterRef('pk'))
+			)
+		)
+
+	def with_statuses(self):
+		"""Prefetch participants and the ordered status rows per trade.
+
+		The prefetched queryset is already sorted newest-first per actor,
+		so Trade._statuses_by_team groups the in-memory rows in a single
+		pass instead of issuing a filtered query per participant.
+		"""
+		return self.prefetch_related(
+			models.Prefetch(
+				'statuses',
+				queryset=TradeStatus.objects.select_related(
+					'actioned_by__owner'
+				).order_by('actioned_by_id', '-created_at'),
+			),
+			'participants',
+		)
+
+
+class Trade(models.Model):
+	sender = models.ForeignKey(
+		Team, on_delete=models.CASCADE, related_name='sent_trades'
+	)
+	participants = models.ManyToManyField(Team, related_name='trades')
+	parent = models.ForeignKey(
+		'self',
+		on_delete=models.CASCADE,
+		related_name='succeeded_by',
+		null=True,
+		blank=True,
+	)
+	done = models.BooleanField(default=False)
+	# Denormalized overall state (-1 closed, 0 open, 1 executed), refreshed
+	# by TradeStatus.save so reads are a plain column fetch.
+	current_status_code = models.SmallIntegerField(default=0)
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	objects = TradeQuerySet.as_manager()
+
+	_participants_cache = None
+	_statuses_by_team_cache = None
+	_snapshot_cache = None
+	_commissioners_cache = None
+	_admins_cache = None
+	_is_latest_cache = None
+
+	def __str__(self):
+		return f'Trade #{self.pk} from {self.sender}'
+
+	def _invalidate_status_caches(self):
+		"""Drop the per-instance snapshots after statuses change."""
+		self._participants_cache = None
+		self._statuses_by_team_cache = None
+		self._snapshot_cache = None
+
+	@property
+	def _participants(self):
+		if self._participants_cache is None:
+			self._participants_cache = list(
+				self.participants.select_related('owner').all()
+			)
+
+		return self._participants_cache
+
+	@property
+	def _statuses_by_team(self):
+		"""Latest status row per actioning team, from one ordered fetch.
+
+		The rows come back newest-first per team, so setdefault keeps the
+		first (latest) one seen and the status properties below never
+		re-issue a filtered query per participant.
+		"""
+		if self._statuses_by_team_cache is None:
+			prefetched = getattr(self, '_prefetched_objects_cache', {})
+
+			if 'statuses' in prefetched:
+				statuses = prefetched['statuses']
+			else:
+				statuses = (
+					self.statuses.all()
+					.select_related('actioned_by')
+					.order_by('actioned_by_id', '-created_at')
+				)
+
+			latest = {}
+
+			for status in statuses:
+				latest.setdefault(status.actioned_by_id, status)
+
+			self._statuses_by_team_cache = latest
+
+		return self._statuses_by_team_cache
+
+	def _latest_status(self, team_id):
+		return self._statuses_by_team.get(team_id)
+
+	def get_commissioners(self):
+		# Direct join on the owner columns; an owner__in=User.objects.filter(...)
+		# subquery here costs an extra nested SELECT for the same rows.
+		return Team.objects.filter(owner__is_staff=True, owner__is_superuser=False)
+
+	def get_admins(self):
+		return Team.objects.filter(owner__is_superuser=True)
+
+	@property
+	def _commissioners(self):
+		"""League commissioners, fetched once per instance with their owners."""
+		if self._commissioners_cache is None:
+			self._commissioners_cache = list(
+				self.get_commissioners().select_related('owner')
+			)
+
+		return self._commissioners_cache
+
+	@property
+	def _admins(self):
+		if self._admins_cache is None:
+			self._admins_cache = list(self.get_admins().select_related('owner'))
+
+		return self._admins_cache
+
+	@property
+	def is_latest(self):
+		"""Whether no counteroffer supersedes this trade.
+
+		The EXISTS probe runs at most once per instance; handle_changes and
+		is_waiting_acceptance both consult it on every status save.
+		"""
+		if self._is_latest_cache is None:
+			has_successor = getattr(self, '_has_successor', None)
+
+			if has_successor is not None:
+				self._is_latest_cache = not has_successor
+			else:
+				self._is_latest_cache = not self.succeeded_by.exists()
+
+		return self._is_latest_cache
+
+	@property
+	def is_counteroffer(self):
+		# parent_id reads the already-loaded column; going through the
+		# descriptor would hydrate the parent Trade from the DB.
+		return self.parent_id is not None
+
+	def _compute_is_accepted(self):
+		for participant in self._participants:
+			if participant.id == self.sender_id:
+				continue
+
+			latest = self._latest_status(participant.id)
+
+			if latest is None or latest.status != TradeStatuses.ACCEPTED:
+				return False
+
+		return True
+
+	def _compute_is_rejected(self):
+		for participant in self._participants:
+			latest = self._latest_status(participant.id)
+
+			if latest is not None and latest.status == TradeStatuses.REJECTED:
+				return True
+
+		return False
+
+	def _has_latest_status(self, team_id, status):
+		latest = self._latest_status(team_id)
+		return latest is not None and latest.status == status
+
+	def _compute_is_vetoed(self):
+		return any(
+			self._has_latest_status(reviewer.id, TradeStatuses.VETOED)
+			for reviewer in self._commissioners + self._admins
+		)
+
+	def _compute_is_approved(self):
+		# An indexed EXISTS settles the admin-override case before paying
+		# for the windowed commissioner aggregate below.
+		admin_approved = TradeStatus.objects.filter(
+			trade=self,
+			status=TradeStatuses.APPROVED,
+			actioned_by__owner__is_superuser=True,
+		).exists()
+
+		if admin_approved:
+			return True
+
+		# Single aggregate: keep each commissioner's newest row via a
+		# window function, then count the approvals in SQL.
+		counts = (
+			TradeStatus.objects.filter(trade=self)
+			.annotate(
+				row_number=Window(
+					RowNumber(),
+					partition_by=[F('actioned_by_id')],
+					order_by=F('created_at').desc(),
+				)
+			)
+			.filter(row_number=1, status=TradeStatuses.APPROVED)
+			.aggregate(
+				commissioner_approvals=Count(
+					'pk',
+					filter=Q(
+						actioned_by__owner__is_staff=True,
+						actioned_by__owner__is_superuser=False,
+					),
+				),
+			)
+		)
+
+		return counts['commissioner_approvals'] > len(self._commissioners) / 2
+
+	def _snapshot(self):
+		"""Compute every status-derived flag once from the cached rows.
+
+		handle_changes reads plain booleans off this namespace instead of
+		re-running each property (and its queries) per branch.
+		"""
+		if self._snapshot_cache is None:
+			snap = SimpleNamespace(
+				is_latest=self.is_latest,
+				is_counteroffer=self.is_counteroffer,
+				is_accepted=self._compute_is_accepted(),
+				is_rejected=self._compute_is_rejected(),
+				is_vetoed=self._compute_is_vetoed(),
+				is_approved=self._compute_is_approved(),
+			)
+			snap.is_waiting_acceptance = (
+				snap.is_latest and not snap.is_accepted and not snap.is_rejected
+			)
+			self._snapshot_cache = snap
+
+		return self._snapshot_cache
+
+	@property
+	def is_accepted(self):
+		return self._snapshot().is_accepted
+
+	@property
+	def is_rejected(self):
+		return self._snapshot().is_rejected
+
+	@property
+	def is_vetoed(self):
+		return self._snapshot().is_vetoed
+
+	@property
+	def is_approved(self):
+		return self._snapshot().is_approved
+
+	@property
+	def is_waiting_acceptance(self):
+		return self._snapshot().is_waiting_acceptance
+
+	@property
+	def status(self):
+		"""Overall trade state: -1 closed, 0 open, 1 executed."""
+		return self.current_status_code
+
+	def _compute_status_code(self):
+		"""Recompute the overall state from the status rows.
+
+		Asks the DB for one settling row through the (trade, status)
+		index instead of loading and scanning every status in Python.
+		"""
+		closing = (
+			TradeStatus.objects.filter(trade=self, status__in=_STATUS_CODES)
+			.only('status')
+			.first()
+		)
+
+		if closing is not None:
+			return _STATUS_CODES[closing.status]
+
+		if not self.statuses.exists():
+			raise ValidationError('Trade has no statuses.')
+
+		return 0
+
+	def refresh_status_code(self):
+		"""Persist the recomputed state with a single UPDATE.
+
+		Always touches updated_at (filter().update() bypasses auto_now)
+		so the column doubles as a version stamp for cached responses.
+		"""
+		code = self._compute_status_code()
+		updates = {'updated_at': timezone.now()}
+
+		if code != self.current_status_code:
+			self.current_status_code = code
+			updates['current_status_code'] = code
+
+		Trade.objects.filter(pk=self.pk).update(**updates)
+
+	def _teams_with_status(self, status):
+		return Team.objects.filter(
+			id__in=TradeStatus.objects.filter(trade=self, status=status).values(
+				'actioned_by_id'
+			)
+		).distinct()
+
+	@property
+	def accepted_by(self):
+		return self._teams_with_status(TradeStatuses.ACCEPTED)
+
+	@property
+	def rejected_by(self):
+		return self._teams_with_status(TradeStatuses.REJECTED)
+
+	def _latest_statuses_for(self, team_ids):
+		"""Build {team_id: latest status dict} from the cached status map."""
+		status_dict = {}
+
+		for team_id in team_ids:
+			latest = self._latest_status(team_id)
+
+			if latest is not None:
+				status_dict[team_id] = fast_obj_to_dict(latest)
+
+		return status_dict
+
+	@property
+	def participant_statuses(self):
+		"""Map each participant team id to a dict of its latest status row."""
+		participant_ids = [participant.id for participant in self._participants]
+		status_dict = self._latest_statuses_for(participant_ids)
+		missing = set(participant_ids) - status_dict.keys()
+
+		if missing:
+			raise ValidationError(f'Unknown status for participants: {missing}')
+
+		return status_dict
+
+	@property
+	def commissioner_statuses(self):
+		"""Map each commissioner team id to a dict of its latest status row."""
+		return self._latest_statuses_for(
+			[commissioner.id for commissioner in self._commissioners]
+		)
+
+	def construct_timeline_entry(self, status):
+		"""Build a timeline entry for a status row, or None for silent rows."""
+		if status.status == TradeStatuses.DRAFT:
+			return None
+
+		action = status.status
+
+		if (
+			status.status == TradeStatuses.SENT
+			and self.sender_id == status.actioned_by_id
+		):
+			action = 'offered'
+
+		return TimelineEntry(
+			team=status.actioned_by, action=action, timestamp=status.created_at
+		)
+
+	@property
+	def timeline(self):
+		"""Deduplicated, chronologically ordered list of trade events."""
+		seen = set()
+		entries = []
+
+		for status in self.statuses.select_related('actioned_by').order_by(
+			'created_at'
+		):
+			entry = self.construct_timeline_entry(status)
+
+			if entry is None:
+				continue
+
+			key = (getattr(entry.team, 'id', None), entry.action, entry.timestamp)
+
+			if key in seen:
+				continue
+
+			seen.add(key)
+			entries.append(entry)
+
+		return entries
+
+	def handle_changes(self):
+		"""Advance the trade after one of its statuses changed."""
+		self._invalidate_status_caches()
+		snap = self._snapshot()
+
+		if not snap.is_latest:
+			return
+
+		participants = self._participants
+
+		if snap.is_vetoed:
+			self._mark_done()
+			self._notify(participants, f'{self} was vetoed by the league.')
+			return
+
+		if snap.is_approved:
+			self._mark_done()
+			self._execute_transfers()
+			participant_ids = [participant.id for participant in participants]
+			non_participants = Team.objects.exclude(id__in=participant_ids)
+			notifications = [
+				Notification(team=participant, message=f'{self} was approved.')
+				for participant in participants
+			]
+			notifications += [
+				Notification(team=team, message=f'{self} was completed.')
+				for team in non_participants
+			]
+			Notification.objects.bulk_create(notifications, batch_size=500)
+
+			for participant in participants:
+				sms_service.send(participant.phone_number, f'{self} was approved.')
+
+			return
+
+		if snap.is_rejected and not snap.is_counteroffer:
+			self._mark_done()
+			self._notify(participants, f'{self} was rejected.')
+			return
+
+		if snap.is_waiting_acceptance:
+			return
+
+		if snap.is_accepted:
+			self.request_commissioner_review()
+
+	def _execute_transfers(self):
+		"""Move every traded asset to its receiver with batched UPDATEs.
+
+		Assets are grouped by receiver so each receiver costs one UPDATE
+		over the collected ids instead of one statement per contract or
+		pick. Protected picks keep the per-object path, since conveyance
+		depends on their individual protection metadata.
+		"""
+		contract_updates = defaultdict(list)
+		pick_updates = defaultdict(list)
+		protected_pick_assets = []
+
+		for asset in self.assets.select_related('draft_pick'):
+			if asset.asset_type == 'player':
+				contract_updates[asset.receiver_id].append(asset.player_contract_id)
+			elif asset.asset_type == 'pick':
+				if asset.draft_pick.protection == 'unprotected':
+					pick_updates[asset.receiver_id].append(asset.draft_pick_id)
+				else:
+					protected_pick_assets.append(asset)
+
+		for receiver_id, contract_ids in contract_updates.items():
+			Contract.objects.filter(pk__in=contract_ids).update(team_id=receiver_id)
+
+		for receiver_id, pick_ids in pick_updates.items():
+			Pick.objects.filter(pk__in=pick_ids).update(current_team_id=receiver_id)
+
+		for asset in protected_pick_assets:
+			asset._handle_draft_pick_transfer()
+
+	def _notify(self, teams, message):
+		Notification.objects.bulk_create(
+			[Notification(team=team, message=message) for team in teams],
+			batch_size=500,
+		)
+
+	def _mark_done(self):
+		if not self.done:
+			self.done = True
+			Trade.objects.filter(pk=self.pk).update(done=True)
+
+	def validate_compliance(self):
+		"""Ensure every participant is involved and stays roster-legal.
+
+		Runs as three batched queries (asset endpoint ids, grouped player
+		counts, grouped salary sums) rather than per-participant
+		exists/count/sum round trips. The two metrics are aggregated
+		separately on purpose: annotating one Team queryset with both
+		joins two reverse relations at once, which multiplies each salary
+		row by the team's player count.
+		"""
+		asset_pairs = list(self.assets.values_list('sender_id', 'receiver_id'))
+		involved = {sender_id for sender_id, _ in asset_pairs}
+		involved.update(receiver_id for _, receiver_id in asset_pairs)
+
+		participant_ids = [participant.id for participant in self._participants]
+		player_counts = dict(
+			Team.objects.filter(id__in=participant_ids)
+			.annotate(player_count=Count('players'))
+			.values_list('id', 'player_count')
+		)
+		salary_sums = dict(
+			Contract.objects.filter(team_id__in=participant_ids)
+			.values('team_id')
+			.annotate(salary_sum=Sum('salary'))
+			.values_list('team_id', 'salary_sum')
+		)
+
+		for participant in self._participants:
+			if participant.id not in involved:
+				raise ValidationError(
+					f'{participant} is not involved in any asset of this trade.'
+				)
+
+			if player_counts.get(participant.id, 0) > MAX_ROSTER_SIZE:
+				raise ValidationError(
+					f'{participant} would exceed the roster limit of '
+					f'{MAX_ROSTER_SIZE} players.'
+				)
+
+			if (salary_sums.get(participant.id) or 0) > SALARY_CAP:
+				raise ValidationError(f'{participant} would exceed the salary cap.')
+
+	@transaction.atomic
+	def make_counteroffer(self, offered_by):
+		"""Clone this offer into a new trade that supersedes it."""
+		counteroffer = Trade.objects.create(sender=offered_by, parent=self)
+		counteroffer.participants.set(self.participants.all())
+
+		new_assets = [
+			TradeAsset(
+				trade=counteroffer,
+				sender_id=asset.sender_id,
+				receiver_id=asset.receiver_id,
+				asset_type=asset.asset_type,
+				player_contract_id=asset.player_contract_id,
+				draft_pick_id=asset.draft_pick_id,
+			)
+			for asset in self.assets.all()
+		]
+		TradeAsset.objects.bulk_create(new_assets, batch_size=500)
+		self._is_latest_cache = False
+
+		return counteroffer
+
+	def create_trade_status_if_needed(self):
+		"""Seed the initial status rows for this trade in one INSERT.
+
+		Participant 'sent' rows (skipped for counteroffers, which inherit
+		context from their parent) and commissioner 'pending' rows go out
+		in a single bulk_create; ignore_conflicts lets the unique_together
+		constraint drop already-present rows without aborting the batch.
+		"""
+		rows = []
+
+		if not self.parent_id:
+			rows += [
+				TradeStatus(
+					trade=self,
+					actioned_by_id=participant.id,
+					status=TradeStatuses.SENT,
+				)
+				for participant in self.participants.only('id')
+			]
+
+		rows += [
+			TradeStatus(
+				trade=self,
+				actioned_by_id=commissioner.id,
+				status=TradeStatuses.PENDING,
+			)
+			for commissioner in self.get_commissioners().only('id')
+		]
+
+		TradeStatus.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+	def request_commissioner_review(self):
+		"""Open a pending review status for every commissioner missing one."""
+		existing = set(self.statuses.values_list('actioned_by_id', flat=True))
+		rows = [
+			TradeStatus(
+				trade=self,
+				actioned_by_id=commissioner.id,
+				status=TradeStatuses.PENDING,
+			)
+			for commissioner in self._commissioners
+			if commissioner.id not in existing
+		]
+
+		if rows:
+			TradeStatus.objects.bulk_create(
+				rows, batch_size=1000, ignore_conflicts=True
+			)
+
+
+class TradeStatus(models.Model):
+	trade = models.ForeignKey(Trade, on_delete=models.CASCADE, related_name='statuses')
+	actioned_by = models.ForeignKey(
+		Team, on_delete=models.CASCADE, related_name='trade_statuses'
+	)
+	status = models.CharField(max_length=20, choices=TradeStatuses.choices)
+	created_at = models.DateTimeField(auto_now_add=True)
+
+	# Built once at class creation; save() and current_status run per status
+	# row, so membership tests hit shared frozensets instead of rebuilding
+	# set literals on every call.
+	_USER_STATUSES = frozenset(
+		{
+			TradeStatuses.DRAFT,
+			TradeStatuses.SENT,
+			TradeStatuses.ACCEPTED,
+			TradeStatuses.REJECTED,
+			TradeStatuses.COUNTEROFFER,
+		}
+	)
+	_COMMISSIONER_STATUSES = frozenset(
+		{
+			TradeStatuses.PENDING,
+			TradeStatuses.APPROVED,
+			TradeStatuses.VETOED,
+		}
+	)
+	_CLOSED_STATUSES = frozenset(
+		{
+			TradeStatuses.REJECTED,
+			TradeStatuses.VETOED,
+		}
+	)
+
+	class Meta:
+		unique_together = ['trade', 'actioned_by', 'status']
+		indexes = [
+			models.Index(
+				fields=['trade', 'actioned_by', '-created_at'],
+				name='ts_trade_actby_created_idx',
+			),
+			models.Index(fields=['trade', 'status'], name='ts_trade_status_idx'),
+		]
+
+	def __str__(self):
+		return f'{self.trade} - {self.actioned_by}: {self.status}'
+
+	@property
+	def current_status(self):
+		"""Contribution of this row to the overall trade state."""
+		if self.status in self._CLOSED_STATUSES:
+			return -1
+
+		if self.status == TradeStatuses.APPROVED:
+			return 1
+
+		return 0
+
+	def save(self, *args, **kwargs):
+		if self.status in self._COMMISSIONER_STATUSES:
+			# One query for both owner flags; walking actioned_by.owner would
+			# hydrate the Team and then the User on every save.
+			is_staff, is_superuser = Team.objects.filter(
+				pk=self.actioned_by_id
+			).values_list('owner__is_staff', 'owner__is_superuser').first() or (
+				False,
+				False,
+			)
+
+			if not (is_staff or is_superuser):
+				raise ValidationError('Only commissioners can use staff-only statuses.')
+
+		if (
+			self.status in self._USER_STATUSES
+			and not self.trade.participants.filter(pk=self.actioned_by_id).exists()
+		):
+			raise ValidationError('Only trade participants can action this status.')
+
+		super().save(*args, **kwargs)
+
+		# isEnabledFor guard: this runs on every status save, so skip the
+		# lazy-formatting machinery entirely when debug logging is off.
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug(
+				'TradeStatus %s saved: trade=%s actioned_by=%s status=%s',
+				self.pk,
+				self.trade_id,
+				self.actioned_by_id,
+				self.status,
+			)
+
+		self.trade.handle_changes()
+		self.trade.refresh_status_code()
+
+
+class TradeAsset(models.Model):
+	ASSET_TYPE_CHOICES = [('player', 'Player'), ('pick', 'Pick')]
+
+	trade = models.ForeignKey(Trade, on_delete=models.CASCADE, related_name='assets')
+	sender = models.ForeignKey(
+		Team, on_delete=models.CASCADE, related_name='sent_trade_assets'
+	)
+	receiver = models.ForeignKey(
+		Team, on_delete=models.CASCADE, related_name='received_trade_assets'
+	)
+	asset_type = models.CharField(max_length=10, choices=ASSET_TYPE_CHOICES)
+	player_contract = models.ForeignKey(
+		Contract,
+		on_delete=models.CASCADE,
+		related_name='trade_assets',
+		null=True,
+		blank=True,
+	)
+	draft_pick = models.ForeignKey(
+		Pick,
+		on_delete=models.CASCADE,
+		related_name='trade_assets',
+		null=True,
+		blank=True,
+	)
+
+	def __str__(self):
+		return f'{self.trade} - {self.asset_type} from {self.sender} to {self.receiver}'
+
+	@cached_property
+	def asset(self):
+		# cached_property: assets are immutable after creation, so the
+		# branch (and any FK hydration) runs at most once per instance.
+		if self.asset_type == 'player':
+			return self.player_contract
+
+		if self.asset_type == 'pick':
+			return self.draft_pick
+
+		raise ValidationError(f'Unknown asset type: {self.asset_type}')
+
+	def _handle_draft_pick_transfer(self):
+		"""Record where a protected pick conveys without moving it yet."""
+		pick = self.draft_pick
+		pick.protection_metadata['conveys_to_team_id'] = self.receiver_id
+		pick.save(update_fields=['protection_metadata'])
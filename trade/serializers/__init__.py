@@ -0,0 +1,3 @@
+from trade.serializers.trade import TradeSerializer
+
+__all__ = ['TradeSerializer']
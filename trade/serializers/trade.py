@@ -0,0 +1,141 @@
+import operator
+
+from django.core.cache import cache
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from core.serializers import SimplePlayerSerializer
+from draft.serializers import PickSerializer
+from trade.models import Trade, TradeAsset
+
+
+# Precomputed per asset type: attribute resolution happens through these
+# shared callables instead of per-row chains of lookups. Both return None
+# when the nullable FK is unset so the loop can reject the row cleanly.
+def _player_asset(asset):
+	contract = asset.player_contract
+	return None if contract is None else contract.player
+
+
+_PICK_ASSET = operator.attrgetter('draft_pick')
+
+# Shared template instances: DRF instantiation and field binding run once
+# at import instead of per get_assets call. Neither child declares a
+# request-dependent field, so forgoing per-call context is safe; a child
+# that grows one must go back to per-call construction.
+_PLAYER_SER = SimplePlayerSerializer()
+_PICK_SER = PickSerializer()
+
+
+class TradeSerializer(serializers.ModelSerializer):
+	assets = serializers.SerializerMethodField()
+
+	class Meta:
+		model = Trade
+		# Explicit so instantiation skips the per-request _meta
+		# introspection '__all__' costs, and so the payload stays stable
+		# when the model grows new columns.
+		fields = (
+			'id',
+			'sender',
+			'participants',
+			'parent',
+			'done',
+			'current_status_code',
+			'created_at',
+			'updated_at',
+			'assets',
+		)
+		# Concrete columns the list endpoint actually renders; the view
+		# chains .only(*fields_for_list) so rows come back this narrow.
+		fields_for_list = (
+			'id',
+			'sender',
+			'parent',
+			'done',
+			'current_status_code',
+			'created_at',
+			'updated_at',
+		)
+
+	@classmethod
+	def setup_eager_loading(cls, queryset):
+		"""Attach every relation get_assets touches before serializing.
+
+		List views call this so the nested player and pick rows arrive
+		with the assets instead of one lazy FK fetch per asset per trade.
+		with_statuses() additionally batches the ordered status rows, so
+		participant_statuses and commissioner_statuses group prefetched
+		data instead of querying per trade.
+		"""
+		return (
+			queryset.select_related('sender')
+			.prefetch_related(
+				Prefetch(
+					'assets',
+					queryset=TradeAsset.objects.select_related(
+						'player_contract__player', 'draft_pick'
+					),
+				),
+			)
+			.with_statuses()
+		)
+
+	def to_representation(self, instance):
+		"""Serve repeat serializations of an unchanged trade from cache.
+
+		The key embeds updated_at, which TradeStatus.save bumps on every
+		status change, so a stale entry is simply never read again and no
+		pattern-based invalidation is needed.
+		"""
+		key = f'trade:{instance.pk}:{instance.updated_at.timestamp()}'
+		data = cache.get(key)
+
+		if data is None:
+			data = super().to_representation(instance)
+			cache.set(key, data, 60 * 60)
+
+		return data
+
+	def get_assets(self, obj):
+		"""Group the trade's assets into serialized player and pick lists.
+
+		Only Trade instances reach this method: write flows bind raw
+		payloads through serializer(data=...) before representation, so
+		the per-row read path stays free of isinstance guards.
+		"""
+		assets = obj.assets.all()
+
+		# len() reads the prefetch cache; exists() would issue a fresh
+		# query and most list rows carry no assets at all.
+		if len(assets) == 0:
+			return {'players': [], 'picks': []}
+
+		players = []
+		picks = []
+		dispatch = {
+			'player': (_player_asset, _PLAYER_SER.to_representation, players.append),
+			'pick': (_PICK_ASSET, _PICK_SER.to_representation, picks.append),
+		}
+
+		# The row loop resolves one dict entry and runs three bound
+		# callables per asset -- no per-row bucket lookups or attribute
+		# resolution, which is as lean as the loop gets in pure Python.
+		for asset in assets:
+			try:
+				getter, represent, append = dispatch[asset.asset_type]
+			except KeyError:
+				raise serializers.ValidationError(
+					f'Unknown asset type: {asset.asset_type}'
+				) from None
+
+			target = getter(asset)
+
+			if target is None:
+				raise serializers.ValidationError(
+					f'Trade asset {asset.pk} has no linked {asset.asset_type}.'
+				)
+
+			append(represent(target))
+
+		return {'players': players, 'picks': picks}
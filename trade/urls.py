@@ -0,0 +1,16 @@
+from django.urls import path
+from rest_framework.routers import DefaultRouter
+
+from trade import views
+
+router = DefaultRouter()
+router.register('trades', views.TradeViewSet, basename='trade')
+
+urlpatterns = [
+	path(
+		'trades/<int:trade_id>/action/',
+		views.TradeActionView.as_view(),
+		name='trade-action',
+	),
+]
+urlpatterns += router.urls
@@ -0,0 +1,259 @@
+from collections import defaultdict
+
+import orjson
+
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.models import Contract, Team
+from draft.models import Pick
+from ftt.common.renderers import ORJSONRenderer
+from trade.enums import TradeStatuses
+from trade.models import Trade, TradeAsset, TradeStatus
+from trade.serializers import TradeSerializer
+
+# One dict lookup both validates and resolves an action name; the enum
+# mapping is walked once at import instead of twice per request.
+_ACTION_MAP = {name: TradeStatuses[name] for name in TradeStatuses._member_names_}
+
+
+def _request_team(request):
+	"""Resolve the caller's team once per request and cache it on it.
+
+	create and the action endpoint both need the team; the cached
+	.only('id') row means at most one narrow query per request.
+	"""
+	team = getattr(request, '_team', None)
+
+	if team is None:
+		team = Team.objects.only('id').get(owner=request.user)
+		request._team = team
+
+	return team
+
+
+class TradeViewSet(viewsets.ModelViewSet):
+	serializer_class = TradeSerializer
+	permission_classes = [IsAuthenticated]
+	renderer_classes = [ORJSONRenderer]
+
+	def _visible_trades(self):
+		user = self.request.user
+		is_privileged = user.is_staff or user.is_superuser
+
+		if is_privileged:
+			return Trade.objects.all()
+
+		return Trade.objects.filter(participants__owner=user).distinct()
+
+	def get_queryset(self):
+		# setup_eager_loading attaches the sender, participants and asset
+		# chains the serializer touches, so detail and stream responses
+		# serialize in a constant number of queries.
+		return TradeSerializer.setup_eager_loading(self._visible_trades())
+
+	# Cache hits skip the ORM and serializer entirely; varying on the
+	# Authorization header keeps each caller's filtered view separate.
+	@method_decorator(cache_page(60 * 5))
+	@method_decorator(vary_on_headers('Authorization'))
+	def list(self, request, *args, **kwargs):
+		"""Assemble the list payload from values() rows.
+
+		The hot list path skips DRF field binding entirely: three
+		values() queries (trades, participants, assets) come back as
+		plain dicts and are stitched together in Python. retrieve keeps
+		the full ModelSerializer behavior.
+		"""
+		rows = list(
+			self._visible_trades().values(*TradeSerializer.Meta.fields_for_list)
+		)
+		trade_ids = [row['id'] for row in rows]
+
+		participants_by_trade = defaultdict(list)
+		participant_rows = Trade.participants.through.objects.filter(
+			trade_id__in=trade_ids
+		).values_list('trade_id', 'team_id')
+
+		for trade_id, team_id in participant_rows:
+			participants_by_trade[trade_id].append(team_id)
+
+		assets_by_trade = defaultdict(lambda: {'players': [], 'picks': []})
+		asset_rows = TradeAsset.objects.filter(trade_id__in=trade_ids).values(
+			'trade_id',
+			'asset_type',
+			'player_contract__player_id',
+			'player_contract__player__name',
+			'player_contract__player__team_id',
+			'draft_pick_id',
+			'draft_pick__original_team_id',
+			'draft_pick__current_team_id',
+			'draft_pick__year',
+			'draft_pick__round_number',
+			'draft_pick__protection',
+		)
+
+		for asset in asset_rows:
+			buckets = assets_by_trade[asset['trade_id']]
+
+			if asset['asset_type'] == 'player':
+				buckets['players'].append(
+					{
+						'id': asset['player_contract__player_id'],
+						'name': asset['player_contract__player__name'],
+						'team': asset['player_contract__player__team_id'],
+					}
+				)
+			else:
+				buckets['picks'].append(
+					{
+						'id': asset['draft_pick_id'],
+						'original_team': asset['draft_pick__original_team_id'],
+						'current_team': asset['draft_pick__current_team_id'],
+						'year': asset['draft_pick__year'],
+						'round_number': asset['draft_pick__round_number'],
+						'protection': asset['draft_pick__protection'],
+					}
+				)
+
+		for row in rows:
+			trade_id = row['id']
+			row['participants'] = participants_by_trade[trade_id]
+			row['assets'] = assets_by_trade[trade_id]
+
+		return JsonResponse(rows, safe=False)
+
+	@method_decorator(cache_page(60 * 5))
+	@method_decorator(vary_on_headers('Authorization'))
+	def retrieve(self, request, *args, **kwargs):
+		return super().retrieve(request, *args, **kwargs)
+
+	@action(detail=False, methods=['get'])
+	def stream(self, request):
+		"""Stream the trade list as JSON, one row at a time.
+
+		iterator(chunk_size=200) keeps the ORM from caching the whole
+		result set and the generator emits each serialized row as it is
+		produced, so peak memory stays flat however many trades match.
+		"""
+		queryset = self.get_queryset()
+		serializer = TradeSerializer(context={'request': request})
+
+		def generate():
+			yield b'{"results":['
+			first = True
+
+			for trade in queryset.iterator(chunk_size=200):
+				prefix = b'' if first else b','
+				first = False
+				row = orjson.dumps(serializer.to_representation(trade), default=str)
+				yield prefix + row
+
+			yield b']}'
+
+		return StreamingHttpResponse(generate(), content_type='application/json')
+
+	def create(self, request, *args, **kwargs):
+		team = _request_team(request)
+		participant_ids = request.data.get('participants', [])
+		assets_data = request.data.get('assets', [])
+
+		# Two in_bulk fetches replace one .get() per referenced contract
+		# and pick inside the loops below.
+		contract_ids = {
+			contract_id
+			for asset_data in assets_data
+			for contract_id in asset_data.get('players', [])
+		}
+		pick_ids = {
+			pick_data['id']
+			for asset_data in assets_data
+			for pick_data in asset_data.get('picks', [])
+		}
+		contracts = Contract.objects.in_bulk(contract_ids)
+		picks = Pick.objects.in_bulk(pick_ids)
+
+		with transaction.atomic():
+			trade = Trade.objects.create(sender=team)
+			trade.participants.set(participant_ids)
+			modified_picks = []
+			to_create = []
+
+			for asset_data in assets_data:
+				sender_id = asset_data['sender']
+				receiver_id = asset_data['receiver']
+
+				for contract_id in asset_data.get('players', []):
+					to_create.append(
+						TradeAsset(
+							trade=trade,
+							sender_id=sender_id,
+							receiver_id=receiver_id,
+							asset_type='player',
+							player_contract=contracts[contract_id],
+						)
+					)
+
+				for pick_data in asset_data.get('picks', []):
+					pick = picks[pick_data['id']]
+					protection = pick_data.get('protection')
+
+					if protection:
+						pick.protection = protection
+						modified_picks.append(pick)
+
+					to_create.append(
+						TradeAsset(
+							trade=trade,
+							sender_id=sender_id,
+							receiver_id=receiver_id,
+							asset_type='pick',
+							draft_pick=pick,
+						)
+					)
+
+			TradeAsset.objects.bulk_create(to_create, batch_size=500)
+
+			if modified_picks:
+				Pick.objects.bulk_update(modified_picks, ['protection'])
+
+			trade.create_trade_status_if_needed()
+
+		serializer = self.get_serializer(trade)
+		return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class TradeActionView(APIView):
+	permission_classes = [IsAuthenticated]
+	renderer_classes = [ORJSONRenderer]
+
+	def post(self, request, trade_id):
+		action = request.data.get('action')
+		status_enum = _ACTION_MAP.get(action.upper()) if action else None
+
+		if status_enum is None:
+			return Response(
+				{'detail': 'Invalid action.'},
+				status=status.HTTP_400_BAD_REQUEST,
+			)
+
+		trade = get_object_or_404(Trade.objects.select_related('sender'), pk=trade_id)
+		team = _request_team(request)
+
+		if status_enum is TradeStatuses.COUNTEROFFER:
+			counteroffer = trade.make_counteroffer(team)
+			return Response(
+				TradeSerializer(counteroffer).data,
+				status=status.HTTP_201_CREATED,
+			)
+
+		TradeStatus.objects.create(trade=trade, actioned_by=team, status=status_enum)
+		return Response(TradeSerializer(trade).data)